@@ -32,7 +32,6 @@ Common error handling code for IDL compiler.
 - Error codes used by the IDL compiler.
 """
 
-import inspect
 import os
 import sys
 from typing import List, Union
@@ -191,7 +190,7 @@ class ParserErrorCollection(object):
     def contains(self, error_id):
         # type: (str) -> bool
         """Check if the error collection has at least one message of a given error_id."""
-        return len([a for a in self._errors if a.error_id == error_id]) > 0
+        return any(a.error_id == error_id for a in self._errors)
 
     def to_list(self):
         # type: () -> List[str]
@@ -981,10 +980,9 @@ class ParserContext(object):
 def _assert_unique_error_messages():
     # type: () -> None
     """Assert that error codes are unique."""
-    error_ids = []
-    for module_member in inspect.getmembers(sys.modules[__name__]):
-        if module_member[0].startswith("ERROR_ID"):
-            error_ids.append(module_member[1])
+    error_ids = [
+        value for name, value in vars(sys.modules[__name__]).items() if name.startswith("ERROR_ID")
+    ]
 
     error_ids_set = set(error_ids)
     if len(error_ids) != len(error_ids_set):
@@ -40,11 +40,12 @@ import argparse
 import logging
 import os
 import sys
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 from idl import parser, syntax, errors, common
 from idl.compiler import CompilerImportResolver
-from idl_compatibility_errors import IDLCompatibilityContext, IDLCompatibilityErrorCollection
+from idl_compatibility_errors import (IDLCompatibilityContext, IDLCompatibilityError,
+                                      IDLCompatibilityErrorCollection)
 
 ALLOW_ANY_TYPE_LIST: List[str] = [
     "commandAllowedAnyTypes", "commandAllowedAnyTypes-param-anyTypeParam",
@@ -599,11 +600,17 @@ def check_namespace(ctxt: IDLCompatibilityContext, old_cmd: syntax.Command, new_
 
 
 def check_error_reply(old_basic_types_path: str, new_basic_types_path: str,
-                      import_directories: List[str]) -> IDLCompatibilityErrorCollection:
-    """Check IDL compatibility between old and new ErrorReply."""
+                      import_directories: List[str],
+                      sink: Optional[Callable[[IDLCompatibilityError], None]] = None
+                      ) -> IDLCompatibilityErrorCollection:
+    """
+    Check IDL compatibility between old and new ErrorReply.
+
+    If a sink is given, errors are passed to it as they are found instead of being collected.
+    """
     old_idl_dir = os.path.dirname(old_basic_types_path)
     new_idl_dir = os.path.dirname(new_basic_types_path)
-    ctxt = IDLCompatibilityContext(old_idl_dir, new_idl_dir, IDLCompatibilityErrorCollection())
+    ctxt = IDLCompatibilityContext(old_idl_dir, new_idl_dir, IDLCompatibilityErrorCollection(sink))
     with open(old_basic_types_path) as old_file:
         old_idl_file = parser.parse(old_file, old_basic_types_path,
                                     CompilerImportResolver(import_directories))
@@ -658,11 +665,16 @@ def check_security_access_check(
                         ctxt.add_new_action_types_not_subset_error(cmd_name, new_idl_file_path)
 
 
-def check_compatibility(old_idl_dir: str, new_idl_dir: str,
-                        import_directories: List[str]) -> IDLCompatibilityErrorCollection:
-    """Check IDL compatibility between old and new IDL commands."""
+def check_compatibility(old_idl_dir: str, new_idl_dir: str, import_directories: List[str],
+                        sink: Optional[Callable[[IDLCompatibilityError], None]] = None
+                        ) -> IDLCompatibilityErrorCollection:
+    """
+    Check IDL compatibility between old and new IDL commands.
+
+    If a sink is given, errors are passed to it as they are found instead of being collected.
+    """
     # pylint: disable=too-many-locals
-    ctxt = IDLCompatibilityContext(old_idl_dir, new_idl_dir, IDLCompatibilityErrorCollection())
+    ctxt = IDLCompatibilityContext(old_idl_dir, new_idl_dir, IDLCompatibilityErrorCollection(sink))
 
     new_commands, new_command_file, new_command_file_path = get_new_commands(
         ctxt, new_idl_dir, import_directories)
@@ -737,19 +749,24 @@ def main():
     """Run the script."""
     arg_parser = argparse.ArgumentParser(description=__doc__)
     arg_parser.add_argument("-v", "--verbose", action="count", help="Enable verbose logging")
+    arg_parser.add_argument("-q", "--quiet", action="store_true",
+                            help="Only report the number of errors found, not each error")
     arg_parser.add_argument("old_idl_dir", metavar="OLD_IDL_DIR",
                             help="Directory where old IDL files are located")
     arg_parser.add_argument("new_idl_dir", metavar="NEW_IDL_DIR",
                             help="Directory where new IDL files are located")
     args = arg_parser.parse_args()
 
-    error_coll = check_compatibility(args.old_idl_dir, args.new_idl_dir, [])
+    # Errors that are not printed do not need to be kept either.
+    sink = (lambda error: None) if args.quiet else None
+
+    error_coll = check_compatibility(args.old_idl_dir, args.new_idl_dir, [], sink)
     if error_coll.has_errors():
         sys.exit(1)
 
     old_basic_types_path = os.path.join(args.old_idl_dir, "mongo/idl/basic_types.idl")
     new_basic_types_path = os.path.join(args.new_idl_dir, "mongo/idl/basic_types.idl")
-    error_reply_coll = check_error_reply(old_basic_types_path, new_basic_types_path, [])
+    error_reply_coll = check_error_reply(old_basic_types_path, new_basic_types_path, [], sink)
     if error_reply_coll.has_errors():
         sys.exit(1)
 
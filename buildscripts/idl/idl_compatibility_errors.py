@@ -32,10 +32,11 @@ Common error handling code for IDL compatibility checker.
 - Error codes used by the IDL compatibility checker.
 """
 
-import inspect
+import enum
+import functools
 import os
 import sys
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 # Public error codes used by IDL compatibility checker.
 # Used by tests cases to validate expected errors are thrown in negative tests.
@@ -104,12 +105,30 @@ ERROR_ID_NEW_ACTION_TYPES_NOT_SUBSET = "ID0060"
 ERROR_ID_TYPE_NOT_ARRAY = "ID0061"
 
 
+class ErrorCategory(enum.IntEnum):
+    """What an IDL compatibility error is about."""
+
+    COMMAND = 0
+    REPLY_FIELD = 1
+    COMMAND_PARAMETER = 2
+    COMMAND_TYPE = 3
+    NAMESPACE = 4
+    ACCESS_CHECK = 5
+
+
 class IDLCompatibilityCheckerError(Exception):
     """Base class for all IDL Compatibility Checker exceptions."""
 
     pass
 
 
+# Every error of a run shares the same old and new IDL directories, so their basenames are cached.
+@functools.lru_cache(maxsize=None)
+def _dir_basename(idl_dir: str) -> str:
+    """Return the basename of an IDL directory."""
+    return os.path.basename(idl_dir)
+
+
 class IDLCompatibilityError(object):
     """
     IDLCompatibilityError represents an error from the IDL compatibility checker.
@@ -117,23 +136,40 @@ class IDLCompatibilityError(object):
     An IDLCompatibilityError consists of
     - error_id - IDxxxx where xxxx is a 0 leading number.
     - command_name - a string, the command where the error occurred.
-    - msg - a string describing an error.
+    - category - an ErrorCategory, what the error is about.
+    - msg - a string describing an error, formatted from the error id's message template, the
+      command name and the error's other positional arguments the first time it is read.
     - old_idl_dir - a string, the directory containing the old IDL files.
     - new_idl_dir - a string, the directory containing the new IDL files.
     - file - a string, the path to the IDL file where the error occurred.
     """
 
+    __slots__ = ("error_id", "command_name", "category", "_args", "_msg", "old_idl_dir",
+                 "new_idl_dir", "file")
+
     #pylint: disable=too-many-arguments
-    def __init__(self, error_id: str, command_name: str, msg: str, old_idl_dir: str,
-                 new_idl_dir: str, file: str) -> None:
+    def __init__(self, error_id: str, command_name: str, category: ErrorCategory,
+                 args: Tuple[Optional[str], ...], old_idl_dir: str, new_idl_dir: str,
+                 file: str) -> None:
         """Construct an IDLCompatibility error."""
         self.error_id = error_id
         self.command_name = command_name
-        self.msg = msg
+        self.category = category
+        self._args = args
+        self._msg: Optional[str] = None
         self.old_idl_dir = old_idl_dir
         self.new_idl_dir = new_idl_dir
         self.file = file
 
+    @property
+    def msg(self) -> str:
+        """Return the error message, formatting it on first use."""
+        if self._msg is None:
+            self._msg = _TEMPLATES[self.error_id].format(self.command_name, *self._args)
+            # The arguments are only needed to build the message.
+            self._args = ()
+        return self._msg
+
     def __str__(self) -> str:
         """Return a formatted error.
 
@@ -142,79 +178,524 @@ class IDLCompatibilityError(object):
         Error in compatibility_test_pass_new/file.idl: ID0001: 'command' has an invalid API
         version '2'.
         """
-        msg = "Comparing %s and %s: Error in %s: %s: %s" % (os.path.basename(self.old_idl_dir),
-                                                            os.path.basename(self.new_idl_dir),
-                                                            self.file, self.error_id, self.msg)
-        return msg
+        return (f"Comparing {_dir_basename(self.old_idl_dir)} and "
+                f"{_dir_basename(self.new_idl_dir)}: Error in {self.file}: {self.error_id}: "
+                f"{self.msg}")
 
 
 class IDLCompatibilityErrorCollection(object):
-    """Collection of IDL compatibility errors with source context information."""
+    """
+    Collection of IDL compatibility errors with source context information.
 
-    def __init__(self) -> None:
-        """Initialize IDLCompatibilityErrorCollection."""
+    A collection built with a sink only counts its errors: has_errors() and count() work and
+    dump_errors() prints just the count, but the methods that look up or list errors raise
+    IDLCompatibilityCheckerError.
+    """
+
+    __slots__ = ("_sink", "_count", "_errors", "_by_error_id", "_by_command", "_seen_errors")
+
+    def __init__(self, sink: Optional[Callable[[IDLCompatibilityError], None]] = None) -> None:
+        """
+        Initialize IDLCompatibilityErrorCollection.
+
+        If a sink is given, each error is passed to it as it is added instead of being kept in the
+        collection, so only the number of errors is tracked. Identical errors are then not
+        dropped, as that would mean remembering every error passed to the sink.
+        """
+        self._sink = sink
+        self._count = 0
+        # Errors are only ever appended and iterated in order, which a list handles with amortized
+        # O(1) appends. A deque would iterate more slowly, and the checker cannot estimate the
+        # number of errors up front to pre-size the list.
         self._errors: List[IDLCompatibilityError] = []
+        # Indexes over _errors so lookups by error id and command name do not scan every error.
+        self._by_error_id: Dict[str, List[IDLCompatibilityError]] = {}
+        self._by_command: Dict[str, List[IDLCompatibilityError]] = {}
+        # Keys of the errors added so far, so an identical error reported again while walking shared
+        # sub-structs is only recorded once.
+        self._seen_errors: Set[Tuple[object, ...]] = set()
 
     #pylint: disable=too-many-arguments
-    def add(self, error_id: str, command_name: str, msg: str, old_idl_dir: str, new_idl_dir: str,
-            file: str) -> None:
-        """Add an error message with directory information."""
-        self._errors.append(
-            IDLCompatibilityError(error_id, command_name, msg, old_idl_dir, new_idl_dir, file))
+    def add(self, old_idl_dir: str, new_idl_dir: str, error_id: str, command_name: str,
+            args: Tuple[Optional[str], ...], file: str,
+            category: Optional[ErrorCategory] = None) -> None:
+        """
+        Add an error and its message arguments with directory information.
+
+        The error's category is looked up from its error id unless one is given.
+        """
+        if category is None:
+            category = _CATEGORIES[error_id]
+        # A command's name and file repeat across all of its errors; interning them lets the errors
+        # share one string each and lets the duplicate check compare them by identity. The name is
+        # not part of the message arguments, so this is the only copy an error keeps.
+        command_name = sys.intern(command_name)
+        file = sys.intern(file)
+        if self._sink is not None:
+            # Nothing is remembered about errors passed to a sink, not even to drop duplicates.
+            self._count += 1
+            self._sink(
+                IDLCompatibilityError(error_id, command_name, category, args, old_idl_dir,
+                                      new_idl_dir, file))
+            return
+        # The directories are fixed by the context, so only the arguments tell two errors with the
+        # same id, command and file apart. The key holds the error's own arguments tuple.
+        key = (error_id, command_name, file, args)
+        if key in self._seen_errors:
+            return
+        self._seen_errors.add(key)
+        error = IDLCompatibilityError(error_id, command_name, category, args, old_idl_dir,
+                                      new_idl_dir, file)
+        self._count += 1
+        self._errors.append(error)
+        self._by_error_id.setdefault(error_id, []).append(error)
+        self._by_command.setdefault(command_name, []).append(error)
+
+    def _check_errors_are_kept(self, method: str) -> None:
+        """Raise if the errors are passed to a sink, so they cannot be looked up or listed."""
+        if self._sink is not None:
+            raise IDLCompatibilityCheckerError(
+                f"IDLCompatibilityErrorCollection.{method}() is not available when errors are "
+                "passed to a sink because the collection does not keep them.")
 
     def has_errors(self) -> bool:
         """Have any errors been added to the collection?."""
-        return len(self._errors) > 0
+        return self._count > 0
 
     def contains(self, error_id: str) -> bool:
         """Check if the error collection has at least one message of a given error_id."""
-        return len([a for a in self._errors if a.error_id == error_id]) > 0
+        self._check_errors_are_kept("contains")
+        return error_id in self._by_error_id
 
     def get_error_by_error_id(self, error_id: str) -> IDLCompatibilityError:
         """Get the first error in the error collection with the id error_id."""
-        error_id_list = [a for a in self._errors if a.error_id == error_id]
-        error = next(iter(error_id_list), None)
-        assert error is not None
-        return error
+        self._check_errors_are_kept("get_error_by_error_id")
+        error_id_list = self._by_error_id.get(error_id)
+        assert error_id_list
+        return error_id_list[0]
 
     def get_error_by_command_name(self, command_name: str) -> IDLCompatibilityError:
         """Get the first error in the error collection with the command command_name."""
-        command_name_list = [a for a in self._errors if a.command_name == command_name]
-        error = next(iter(command_name_list), None)
-        assert error is not None
-        return error
+        self._check_errors_are_kept("get_error_by_command_name")
+        command_name_list = self._by_command.get(command_name)
+        assert command_name_list
+        return command_name_list[0]
 
     def get_error_by_command_name_and_error_id(self, command_name: str,
                                                error_id: str) -> IDLCompatibilityError:
         """Get the first error in the error collection from command_name with error_id."""
-        command_name_list = [a for a in self._errors if a.command_name == command_name]
-        error_id_list = [a for a in command_name_list if a.error_id == error_id]
-        error = next(iter(error_id_list), None)
+        self._check_errors_are_kept("get_error_by_command_name_and_error_id")
+        error = next((a for a in self._by_command.get(command_name, []) if a.error_id == error_id),
+                     None)
         assert error is not None
         return error
 
     def get_all_errors_by_command_name(self, command_name: str) -> List[IDLCompatibilityError]:
         """Get all the errors in the error collection with the command command_name."""
-        return [a for a in self._errors if a.command_name == command_name]
+        self._check_errors_are_kept("get_all_errors_by_command_name")
+        return list(self._by_command.get(command_name, []))
 
     def to_list(self) -> List[str]:
         """Return a list of formatted error messages."""
+        self._check_errors_are_kept("to_list")
         return [str(error) for error in self._errors]
 
     def dump_errors(self) -> None:
-        """Print the list of errors."""
+        """Print the list of errors, or only their count if they were passed to a sink."""
+        if self._sink is not None:
+            print(f"Found {self.count()} errors")
+            return
         print("Errors found while checking IDL compatibility")
-        for error_msg in self.to_list():
-            print("%s\n\n" % error_msg)
-        print("Found %s errors" % (len(self.to_list())))
+        for error in self._errors:
+            print(f"{error}\n\n")
+        print(f"Found {self.count()} errors")
 
     def count(self) -> int:
         """Return the count of errors."""
-        return len(self._errors)
+        return self._count
 
     def __str__(self) -> str:
         """Return a list of errors."""
-        return ', '.join(self.to_list())
+        self._check_errors_are_kept("__str__")
+        return ', '.join(map(str, self._errors))
+
+
+# Message templates of the errors, keyed by error id. The placeholders are filled in from the
+# command name, as {0}, and the positional arguments the error was added with the first time its
+# message is read.
+_TEMPLATES = {
+    ERROR_ID_COMMAND_INVALID_API_VERSION:
+        "'{0}' has an invalid API version '{1}'",
+    ERROR_ID_DUPLICATE_COMMAND_NAME:
+        "'{1}' has duplicate command: '{0}'",
+    ERROR_ID_REMOVED_COMMAND:
+        "Old command '{0}' was removed from new commands.",
+    ERROR_ID_NEW_REPLY_FIELD_UNSTABLE: ("'{0}' has an unstable reply field or sub-field "
+                                        "'{1}' that was stable in the old command."),
+    ERROR_ID_NEW_REPLY_FIELD_OPTIONAL: ("'{0}' has an optional reply field or sub-field "
+                                        "'{1}' that was non-optional in the old command."),
+    ERROR_ID_NEW_REPLY_FIELD_MISSING: ("'{0}' is missing a reply field or sub-field '{1}' "
+                                       "that exists in the old command."),
+    ERROR_ID_NEW_REPLY_FIELD_TYPE_NOT_STRUCT: (
+        "'{0}' has a reply field or sub-field '{1}' of type "
+        "'{2}' that is not a struct while the corresponding old "
+        "reply field was a struct of type '{3}'."),
+    ERROR_ID_NEW_REPLY_FIELD_TYPE_NOT_ENUM: (
+        "'{0}' has a reply field or sub-field '{1}' of type "
+        "'{2}' that is not an enum while the corresponding old "
+        "reply field was an enum of type '{3}'."),
+    ERROR_ID_OLD_REPLY_FIELD_BSON_SERIALIZATION_TYPE_ANY: (
+        "'{0}' has an old reply field or sub-field '{1}' of "
+        "type '{2}' that has a bson serialization type 'any'"),
+    ERROR_ID_NEW_REPLY_FIELD_BSON_SERIALIZATION_TYPE_ANY: (
+        "'{0}' has a new reply field or sub-field '{1}' of "
+        "type '{2}' that has a bson serialization type 'any'"),
+    ERROR_ID_NEW_REPLY_FIELD_TYPE_ENUM_OR_STRUCT: (
+        "'{0}' has a reply field or sub-field '{1}' of type "
+        "'{2}' that is an enum or struct while the corresponding "
+        "old reply field was a non-enum or struct of type '{3}'."),
+    ERROR_ID_REPLY_FIELD_TYPE_INVALID: ("'{0}' has a reply field or sub-field '{1}' that has "
+                                        "an invalid type"),
+    ERROR_ID_REPLY_FIELD_NOT_SUBSET: (
+        "'{0}' has a reply field or sub-field '{1}' with "
+        "type '{2}' that is not a subset of the other version of this "
+        "reply field."),
+    ERROR_ID_NEW_NAMESPACE_INCOMPATIBLE: ("'{0}' has namespace '{1}' that is incompatible "
+                                          "with the old namespace '{2}'."),
+    ERROR_ID_COMMAND_TYPE_NOT_SUPERSET: (
+        "The command '{0}' or its sub-struct has type '{1}' "
+        "that is not a superset of the older version of this struct type."),
+    ERROR_ID_COMMAND_TYPE_INVALID: ("'{0}' has an invalid type or has a sub-struct with an "
+                                    "invalid type"),
+    ERROR_ID_OLD_COMMAND_TYPE_BSON_SERIALIZATION_TYPE_ANY: (
+        "'{0}' or its sub-struct has type '{1}' that has a "
+        "bson serialization type 'any'"),
+    ERROR_ID_NEW_COMMAND_TYPE_BSON_SERIALIZATION_TYPE_ANY: (
+        "The '{0}' command or its sub-struct has type '{1}' "
+        "that has a bson serialization type 'any'"),
+    ERROR_ID_NEW_COMMAND_TYPE_FIELD_MISSING: (
+        "The command '{0}' or its sub-struct has type '{2}' "
+        "that is missing a field '{1}' that exists in the old struct "
+        "type."),
+    ERROR_ID_NEW_COMMAND_TYPE_FIELD_REQUIRED: (
+        "'{0}' or its sub-struct has type '{2}' with a "
+        "required type field '{1}' that was optional in the old struct "
+        "type."),
+    ERROR_ID_NEW_COMMAND_TYPE_FIELD_UNSTABLE: (
+        "'{0}' or its sub-struct has type '{2}' with an "
+        "unstable field '{1}' that was stable in the old struct type."),
+    ERROR_ID_NEW_COMMAND_TYPE_NOT_STRUCT: (
+        "'{0}' or its sub-struct has type '{1}' that is not a "
+        "struct while the corresponding old type was a struct of type "
+        "'{2}'."),
+    ERROR_ID_NEW_COMMAND_TYPE_NOT_ENUM: (
+        "'{0}' or its sub-struct has type '{1}' that is not an "
+        "enum while the corresponding old type was an enum of type '{2}'."),
+    ERROR_ID_NEW_COMMAND_TYPE_ENUM_OR_STRUCT: (
+        "The command '{0}' or its sub-struct has type '{1}' "
+        "that is an enum or struct while the correspondingold type was a "
+        "non-enum or struct of type '{2}'."),
+    ERROR_ID_MISSING_ERROR_REPLY_STRUCT:
+        "'{1}' is missing the ErrorReply struct",
+    ERROR_ID_NEW_REPLY_FIELD_VARIANT_TYPE: (
+        "'{0}' has a reply field or sub-field '{1}' that has "
+        "a variant type while the corresponding old reply field type "
+        "'{2}' is not variant."),
+    ERROR_ID_NEW_REPLY_FIELD_VARIANT_TYPE_NOT_SUBSET: (
+        "'{0}' has a reply field or sub-field '{1}' with "
+        "variant types that is not a subset of the corresponding old reply field "
+        "types: The type '{2}' is not in the old reply field "
+        "types."),
+    ERROR_ID_REMOVED_COMMAND_PARAMETER: ("Field or sub-field '{1}' for old command '{0}' was "
+                                         "removed from the corresponding newstruct."),
+    ERROR_ID_ADDED_REQUIRED_COMMAND_PARAMETER: ("New field or sub-field '{1}' for command '{0}' is "
+                                                "required when it should be optional."),
+    ERROR_ID_COMMAND_PARAMETER_UNSTABLE: ("'{0}' has an unstable field or sub-field '{1}' that "
+                                          "was stable in the old struct."),
+    ERROR_ID_COMMAND_PARAMETER_STABLE_REQUIRED: (
+        "'{0}' has a stable required field or sub-field "
+        "'{1}' that was unstable in the old struct. The new field "
+        "should be optional."),
+    ERROR_ID_COMMAND_PARAMETER_REQUIRED: ("'{0}' has a required field or sub-field '{1}' that "
+                                          "was optional in the old struct."),
+    ERROR_ID_OLD_COMMAND_PARAMETER_TYPE_BSON_SERIALIZATION_TYPE_ANY: (
+        "The '{0}'' command has field or sub-field '{2}' "
+        "that has type '{1}' that has a bson serialization type 'any'"),
+    ERROR_ID_NEW_COMMAND_PARAMETER_TYPE_BSON_SERIALIZATION_TYPE_ANY: (
+        "The '{0}' command has field or sub-field '{2}' that "
+        "has type '{1}' that has a bson serialization type 'any'"),
+    ERROR_ID_NEW_COMMAND_PARAMETER_TYPE_NOT_STRUCT: (
+        "The '{0}' command has field or sub-field '{3}' of "
+        "type '{1}' that is not a struct while the corresponding old "
+        "field type was a struct of type '{2}'."),
+    ERROR_ID_NEW_COMMAND_PARAMETER_TYPE_NOT_ENUM: (
+        "The '{0}' command has field or sub-field '{3}' of "
+        "type '{1}' that is not an enum while the corresponding old field "
+        "type was an enum of type '{2}'."),
+    ERROR_ID_NEW_COMMAND_PARAMETER_TYPE_ENUM_OR_STRUCT: (
+        "The command '{0}' has field or sub-field '{3}' of "
+        "type '{1}' that is an enum or struct while the corresponding old "
+        "field type is a non-enum or non-struct of type '{2}'."),
+    ERROR_ID_COMMAND_PARAMETER_TYPE_INVALID: ("The '{0}' command has a field or sub-field '{1}' "
+                                              "that has an invalid type"),
+    ERROR_ID_COMMAND_PARAMETER_TYPE_NOT_SUPERSET: (
+        "The command '{0}' has field or sub-field '{2}' with "
+        "type '{1}' that is not a superset of the older version of this "
+        "field type."),
+    ERROR_ID_REPLY_FIELD_CONTAINS_VALIDATOR: (
+        "The new version of the command '{0}' has a reply field or "
+        "sub-field '{1}' that contains a validator while the old "
+        "version does not"),
+    ERROR_ID_COMMAND_PARAMETER_CONTAINS_VALIDATOR: (
+        "Field or sub-field '{1}' for new command '{0}' "
+        "contains a validator while the old field does not."),
+    ERROR_ID_COMMAND_PARAMETER_VALIDATORS_NOT_EQUAL: (
+        "Validator for field or sub-field '{1}' in old command "
+        "'{0}' is not equal to the validator in the new version of "
+        "the field"),
+    ERROR_ID_COMMAND_TYPE_CONTAINS_VALIDATOR: (
+        "The command '{0}' or its sub-struct has type '{2}' "
+        "with field '{1}' that contains a validator while the old "
+        "struct type does not."),
+    ERROR_ID_COMMAND_TYPE_VALIDATORS_NOT_EQUAL: (
+        "Validator for field '{1}' in type '{2}' in old command "
+        "'{0}' or its sub-struct is not equal to the validator in the "
+        "new struct type."),
+    ERROR_ID_NEW_COMMAND_TYPE_FIELD_STABLE_REQUIRED: (
+        "'{0}' or its sub-struct has type '{2}' with a stable "
+        "and required type field '{1}' that was unstable in the old "
+        "struct type."),
+    ERROR_ID_NEW_COMMAND_TYPE_FIELD_ADDED_REQUIRED: (
+        "The command '{0}' or its sub-struct has type '{2}' "
+        "with an added and required type field '{1}' that did not exist "
+        "in the old struct type."),
+    ERROR_ID_REPLY_FIELD_BSON_SERIALIZATION_TYPE_ANY_NOT_ALLOWED: (
+        "'{0}' has an old and new reply field or sub-field "
+        "'{1}' of type '{2}' that has a bson serialization type "
+        "'any' when it is not explicitly allowed."),
+    ERROR_ID_COMMAND_PARAMETER_BSON_SERIALIZATION_TYPE_ANY_NOT_ALLOWED: (
+        "'{0}' has an old and new field or sub-field '{2}' "
+        "of type '{1}' that has a bson serialization type 'any' when it "
+        "is not explicitly allowed."),
+    ERROR_ID_COMMAND_TYPE_BSON_SERIALIZATION_TYPE_ANY_NOT_ALLOWED: (
+        "'{0}' or its sub-struct has an old and new type "
+        "'{1}' that has a bson serialization type 'any' when it is not "
+        "explicitly allowed."),
+    ERROR_ID_COMMAND_PARAMETER_CPP_TYPE_NOT_EQUAL: (
+        "'{0}' has field or sub-field '{2}' of type "
+        "'{1}' that has  cpp_type that is not equal in the old and new "
+        "versions"),
+    ERROR_ID_COMMAND_CPP_TYPE_NOT_EQUAL: (
+        "'{0}' or its sub-struct has command type '{1}' that "
+        "has cpp_type that is not equal in the old and new versions"),
+    ERROR_ID_REPLY_FIELD_CPP_TYPE_NOT_EQUAL: (
+        "'{0}' has a reply field or sub-field '{1}' of type "
+        "'{2}' that has cpp_type that is not equal in the old and new "
+        "versions."),
+    ERROR_ID_NEW_COMMAND_PARAMETER_TYPE_NOT_VARIANT: (
+        "The '{0}' command has field or sub-field '{2}' of "
+        "type '{1}' that is not variant while the corresponding old field "
+        "type is variant."),
+    ERROR_ID_NEW_COMMAND_TYPE_NOT_VARIANT: ("'{0}' or its sub-struct has type '{1}' that is not "
+                                            "variant while the corresponding old type is variant."),
+    ERROR_ID_NEW_COMMAND_PARAMETER_VARIANT_TYPE_NOT_SUPERSET: (
+        "The '{0}' command has field or sub-field '{2}' of "
+        "variant types that is not a superset of the corresponding old field "
+        "variant types: The type '{1}' is in the old field types "
+        "but not the new field types."),
+    ERROR_ID_NEW_COMMAND_VARIANT_TYPE_NOT_SUPERSET: (
+        "'{0}' or its sub-struct has variant types that is not a "
+        "supserset of the corresponding old command variant types: The type "
+        "'{1}' is in the old command types but not the new "
+        "command types."),
+    ERROR_ID_REPLY_FIELD_VALIDATORS_NOT_EQUAL: (
+        "Validator for reply field or sub-field '{0}' in old command "
+        "'{1}' is not equal to the validator in the new version of the "
+        "reply field"),
+    ERROR_ID_CHECK_NOT_EQUAL: ("'{0}' has a new check '{1}' that is not equal to the "
+                               "old check '{2}'"),
+    ERROR_ID_RESOURCE_PATTERN_NOT_EQUAL: ("'{0}' has a new resource pattern '{1}' "
+                                          "that is not equal to the old resource pattern '{2}'"),
+    ERROR_ID_NEW_ACTION_TYPES_NOT_SUBSET: (
+        "'{0}' has new action types that are not a subset of the old "
+        "action types"),
+    ERROR_ID_TYPE_NOT_ARRAY: ("The command '{0}' has {1}: '{2}' with new "
+                              "type '{3}' while the older type was '{4}'."),
+}
+
+# Category of each error, keyed by error id, so errors can be filtered by what they are about
+# without matching on their messages. ERROR_ID_TYPE_NOT_ARRAY is left out because its category
+# depends on the symbol it is reported for, see _TYPE_NOT_ARRAY_CATEGORIES.
+_CATEGORIES = {
+    ERROR_ID_COMMAND_INVALID_API_VERSION:
+        ErrorCategory.COMMAND,
+    ERROR_ID_DUPLICATE_COMMAND_NAME:
+        ErrorCategory.COMMAND,
+    ERROR_ID_REMOVED_COMMAND:
+        ErrorCategory.COMMAND,
+    ERROR_ID_MISSING_ERROR_REPLY_STRUCT:
+        ErrorCategory.COMMAND,
+    ERROR_ID_NEW_REPLY_FIELD_UNSTABLE:
+        ErrorCategory.REPLY_FIELD,
+    ERROR_ID_NEW_REPLY_FIELD_OPTIONAL:
+        ErrorCategory.REPLY_FIELD,
+    ERROR_ID_NEW_REPLY_FIELD_MISSING:
+        ErrorCategory.REPLY_FIELD,
+    ERROR_ID_NEW_REPLY_FIELD_TYPE_NOT_STRUCT:
+        ErrorCategory.REPLY_FIELD,
+    ERROR_ID_NEW_REPLY_FIELD_TYPE_NOT_ENUM:
+        ErrorCategory.REPLY_FIELD,
+    ERROR_ID_OLD_REPLY_FIELD_BSON_SERIALIZATION_TYPE_ANY:
+        ErrorCategory.REPLY_FIELD,
+    ERROR_ID_NEW_REPLY_FIELD_BSON_SERIALIZATION_TYPE_ANY:
+        ErrorCategory.REPLY_FIELD,
+    ERROR_ID_NEW_REPLY_FIELD_TYPE_ENUM_OR_STRUCT:
+        ErrorCategory.REPLY_FIELD,
+    ERROR_ID_REPLY_FIELD_TYPE_INVALID:
+        ErrorCategory.REPLY_FIELD,
+    ERROR_ID_REPLY_FIELD_NOT_SUBSET:
+        ErrorCategory.REPLY_FIELD,
+    ERROR_ID_NEW_REPLY_FIELD_VARIANT_TYPE:
+        ErrorCategory.REPLY_FIELD,
+    ERROR_ID_NEW_REPLY_FIELD_VARIANT_TYPE_NOT_SUBSET:
+        ErrorCategory.REPLY_FIELD,
+    ERROR_ID_REPLY_FIELD_CONTAINS_VALIDATOR:
+        ErrorCategory.REPLY_FIELD,
+    ERROR_ID_REPLY_FIELD_BSON_SERIALIZATION_TYPE_ANY_NOT_ALLOWED:
+        ErrorCategory.REPLY_FIELD,
+    ERROR_ID_REPLY_FIELD_CPP_TYPE_NOT_EQUAL:
+        ErrorCategory.REPLY_FIELD,
+    ERROR_ID_REPLY_FIELD_VALIDATORS_NOT_EQUAL:
+        ErrorCategory.REPLY_FIELD,
+    ERROR_ID_REMOVED_COMMAND_PARAMETER:
+        ErrorCategory.COMMAND_PARAMETER,
+    ERROR_ID_ADDED_REQUIRED_COMMAND_PARAMETER:
+        ErrorCategory.COMMAND_PARAMETER,
+    ERROR_ID_COMMAND_PARAMETER_UNSTABLE:
+        ErrorCategory.COMMAND_PARAMETER,
+    ERROR_ID_COMMAND_PARAMETER_STABLE_REQUIRED:
+        ErrorCategory.COMMAND_PARAMETER,
+    ERROR_ID_COMMAND_PARAMETER_REQUIRED:
+        ErrorCategory.COMMAND_PARAMETER,
+    ERROR_ID_OLD_COMMAND_PARAMETER_TYPE_BSON_SERIALIZATION_TYPE_ANY:
+        ErrorCategory.COMMAND_PARAMETER,
+    ERROR_ID_NEW_COMMAND_PARAMETER_TYPE_BSON_SERIALIZATION_TYPE_ANY:
+        ErrorCategory.COMMAND_PARAMETER,
+    ERROR_ID_NEW_COMMAND_PARAMETER_TYPE_NOT_STRUCT:
+        ErrorCategory.COMMAND_PARAMETER,
+    ERROR_ID_NEW_COMMAND_PARAMETER_TYPE_NOT_ENUM:
+        ErrorCategory.COMMAND_PARAMETER,
+    ERROR_ID_NEW_COMMAND_PARAMETER_TYPE_ENUM_OR_STRUCT:
+        ErrorCategory.COMMAND_PARAMETER,
+    ERROR_ID_COMMAND_PARAMETER_TYPE_INVALID:
+        ErrorCategory.COMMAND_PARAMETER,
+    ERROR_ID_COMMAND_PARAMETER_TYPE_NOT_SUPERSET:
+        ErrorCategory.COMMAND_PARAMETER,
+    ERROR_ID_COMMAND_PARAMETER_CONTAINS_VALIDATOR:
+        ErrorCategory.COMMAND_PARAMETER,
+    ERROR_ID_COMMAND_PARAMETER_VALIDATORS_NOT_EQUAL:
+        ErrorCategory.COMMAND_PARAMETER,
+    ERROR_ID_COMMAND_PARAMETER_BSON_SERIALIZATION_TYPE_ANY_NOT_ALLOWED:
+        ErrorCategory.COMMAND_PARAMETER,
+    ERROR_ID_COMMAND_PARAMETER_CPP_TYPE_NOT_EQUAL:
+        ErrorCategory.COMMAND_PARAMETER,
+    ERROR_ID_NEW_COMMAND_PARAMETER_TYPE_NOT_VARIANT:
+        ErrorCategory.COMMAND_PARAMETER,
+    ERROR_ID_NEW_COMMAND_PARAMETER_VARIANT_TYPE_NOT_SUPERSET:
+        ErrorCategory.COMMAND_PARAMETER,
+    ERROR_ID_COMMAND_TYPE_NOT_SUPERSET:
+        ErrorCategory.COMMAND_TYPE,
+    ERROR_ID_COMMAND_TYPE_INVALID:
+        ErrorCategory.COMMAND_TYPE,
+    ERROR_ID_OLD_COMMAND_TYPE_BSON_SERIALIZATION_TYPE_ANY:
+        ErrorCategory.COMMAND_TYPE,
+    ERROR_ID_NEW_COMMAND_TYPE_BSON_SERIALIZATION_TYPE_ANY:
+        ErrorCategory.COMMAND_TYPE,
+    ERROR_ID_NEW_COMMAND_TYPE_FIELD_MISSING:
+        ErrorCategory.COMMAND_TYPE,
+    ERROR_ID_NEW_COMMAND_TYPE_FIELD_REQUIRED:
+        ErrorCategory.COMMAND_TYPE,
+    ERROR_ID_NEW_COMMAND_TYPE_FIELD_UNSTABLE:
+        ErrorCategory.COMMAND_TYPE,
+    ERROR_ID_NEW_COMMAND_TYPE_NOT_STRUCT:
+        ErrorCategory.COMMAND_TYPE,
+    ERROR_ID_NEW_COMMAND_TYPE_NOT_ENUM:
+        ErrorCategory.COMMAND_TYPE,
+    ERROR_ID_NEW_COMMAND_TYPE_ENUM_OR_STRUCT:
+        ErrorCategory.COMMAND_TYPE,
+    ERROR_ID_COMMAND_TYPE_CONTAINS_VALIDATOR:
+        ErrorCategory.COMMAND_TYPE,
+    ERROR_ID_COMMAND_TYPE_VALIDATORS_NOT_EQUAL:
+        ErrorCategory.COMMAND_TYPE,
+    ERROR_ID_NEW_COMMAND_TYPE_FIELD_STABLE_REQUIRED:
+        ErrorCategory.COMMAND_TYPE,
+    ERROR_ID_NEW_COMMAND_TYPE_FIELD_ADDED_REQUIRED:
+        ErrorCategory.COMMAND_TYPE,
+    ERROR_ID_COMMAND_TYPE_BSON_SERIALIZATION_TYPE_ANY_NOT_ALLOWED:
+        ErrorCategory.COMMAND_TYPE,
+    ERROR_ID_COMMAND_CPP_TYPE_NOT_EQUAL:
+        ErrorCategory.COMMAND_TYPE,
+    ERROR_ID_NEW_COMMAND_TYPE_NOT_VARIANT:
+        ErrorCategory.COMMAND_TYPE,
+    ERROR_ID_NEW_COMMAND_VARIANT_TYPE_NOT_SUPERSET:
+        ErrorCategory.COMMAND_TYPE,
+    ERROR_ID_NEW_NAMESPACE_INCOMPATIBLE:
+        ErrorCategory.NAMESPACE,
+    ERROR_ID_CHECK_NOT_EQUAL:
+        ErrorCategory.ACCESS_CHECK,
+    ERROR_ID_RESOURCE_PATTERN_NOT_EQUAL:
+        ErrorCategory.ACCESS_CHECK,
+    ERROR_ID_NEW_ACTION_TYPES_NOT_SUBSET:
+        ErrorCategory.ACCESS_CHECK,
+}
+
+# Category of an ERROR_ID_TYPE_NOT_ARRAY error, keyed by the kind of symbol whose type is not an
+# array. The same error id is reported for reply fields, command parameters and command types.
+_TYPE_NOT_ARRAY_CATEGORIES = {
+    "reply_field": ErrorCategory.REPLY_FIELD,
+    "command_parameter": ErrorCategory.COMMAND_PARAMETER,
+    "command_namespace": ErrorCategory.COMMAND_TYPE,
+}
+
+# Error ids of the errors that apply to either a command type or a command parameter, indexed by
+# whether the error is about a command parameter.
+_TYPE_INVALID_ERROR_IDS = (ERROR_ID_COMMAND_TYPE_INVALID, ERROR_ID_COMMAND_PARAMETER_TYPE_INVALID)
+_TYPE_NOT_SUPERSET_ERROR_IDS = (ERROR_ID_COMMAND_TYPE_NOT_SUPERSET,
+                                ERROR_ID_COMMAND_PARAMETER_TYPE_NOT_SUPERSET)
+_TYPE_CONTAINS_VALIDATOR_ERROR_IDS = (ERROR_ID_COMMAND_TYPE_CONTAINS_VALIDATOR,
+                                      ERROR_ID_COMMAND_PARAMETER_CONTAINS_VALIDATOR)
+_TYPE_VALIDATORS_NOT_EQUAL_ERROR_IDS = (ERROR_ID_COMMAND_TYPE_VALIDATORS_NOT_EQUAL,
+                                        ERROR_ID_COMMAND_PARAMETER_VALIDATORS_NOT_EQUAL)
+_NEW_TYPE_BSON_ANY_ERROR_IDS = (ERROR_ID_NEW_COMMAND_TYPE_BSON_SERIALIZATION_TYPE_ANY,
+                                ERROR_ID_NEW_COMMAND_PARAMETER_TYPE_BSON_SERIALIZATION_TYPE_ANY)
+_NEW_TYPE_ENUM_OR_STRUCT_ERROR_IDS = (ERROR_ID_NEW_COMMAND_TYPE_ENUM_OR_STRUCT,
+                                      ERROR_ID_NEW_COMMAND_PARAMETER_TYPE_ENUM_OR_STRUCT)
+_NEW_TYPE_FIELD_ADDED_REQUIRED_ERROR_IDS = (ERROR_ID_NEW_COMMAND_TYPE_FIELD_ADDED_REQUIRED,
+                                            ERROR_ID_ADDED_REQUIRED_COMMAND_PARAMETER)
+_NEW_TYPE_FIELD_MISSING_ERROR_IDS = (ERROR_ID_NEW_COMMAND_TYPE_FIELD_MISSING,
+                                     ERROR_ID_REMOVED_COMMAND_PARAMETER)
+_NEW_TYPE_FIELD_REQUIRED_ERROR_IDS = (ERROR_ID_NEW_COMMAND_TYPE_FIELD_REQUIRED,
+                                      ERROR_ID_COMMAND_PARAMETER_REQUIRED)
+_NEW_TYPE_FIELD_STABLE_REQUIRED_ERROR_IDS = (ERROR_ID_NEW_COMMAND_TYPE_FIELD_STABLE_REQUIRED,
+                                             ERROR_ID_COMMAND_PARAMETER_STABLE_REQUIRED)
+_NEW_TYPE_FIELD_UNSTABLE_ERROR_IDS = (ERROR_ID_NEW_COMMAND_TYPE_FIELD_UNSTABLE,
+                                      ERROR_ID_COMMAND_PARAMETER_UNSTABLE)
+_NEW_TYPE_NOT_ENUM_ERROR_IDS = (ERROR_ID_NEW_COMMAND_TYPE_NOT_ENUM,
+                                ERROR_ID_NEW_COMMAND_PARAMETER_TYPE_NOT_ENUM)
+_NEW_TYPE_NOT_STRUCT_ERROR_IDS = (ERROR_ID_NEW_COMMAND_TYPE_NOT_STRUCT,
+                                  ERROR_ID_NEW_COMMAND_PARAMETER_TYPE_NOT_STRUCT)
+_NEW_TYPE_NOT_VARIANT_TYPE_ERROR_IDS = (ERROR_ID_NEW_COMMAND_TYPE_NOT_VARIANT,
+                                        ERROR_ID_NEW_COMMAND_PARAMETER_TYPE_NOT_VARIANT)
+_NEW_VARIANT_TYPE_NOT_SUPERSET_ERROR_IDS = (
+    ERROR_ID_NEW_COMMAND_VARIANT_TYPE_NOT_SUPERSET,
+    ERROR_ID_NEW_COMMAND_PARAMETER_VARIANT_TYPE_NOT_SUPERSET)
+_OLD_TYPE_BSON_ANY_ERROR_IDS = (ERROR_ID_OLD_COMMAND_TYPE_BSON_SERIALIZATION_TYPE_ANY,
+                                ERROR_ID_OLD_COMMAND_PARAMETER_TYPE_BSON_SERIALIZATION_TYPE_ANY)
+_TYPE_BSON_ANY_NOT_ALLOWED_ERROR_IDS = (
+    ERROR_ID_COMMAND_TYPE_BSON_SERIALIZATION_TYPE_ANY_NOT_ALLOWED,
+    ERROR_ID_COMMAND_PARAMETER_BSON_SERIALIZATION_TYPE_ANY_NOT_ALLOWED)
+_CPP_TYPE_NOT_EQUAL_ERROR_IDS = (ERROR_ID_COMMAND_CPP_TYPE_NOT_EQUAL,
+                                 ERROR_ID_COMMAND_PARAMETER_CPP_TYPE_NOT_EQUAL)
 
 
 class IDLCompatibilityContext(object):
@@ -228,72 +709,50 @@ class IDLCompatibilityContext(object):
 
     # pylint:disable=too-many-public-methods
 
+    __slots__ = ("old_idl_dir", "new_idl_dir", "errors", "_add_error")
+
     def __init__(self, old_idl_dir: str, new_idl_dir: str,
                  errors: IDLCompatibilityErrorCollection) -> None:
         """Construct a new IDLCompatibilityContext."""
         self.old_idl_dir = old_idl_dir
         self.new_idl_dir = new_idl_dir
         self.errors = errors
-
-    def _add_error(self, error_id: str, command_name: str, msg: str, file: str) -> None:
-        """Add an error with an error id and error message."""
-        self.errors.add(error_id, command_name, msg, self.old_idl_dir, self.new_idl_dir, file)
+        # Add an error with an error id, its message arguments and a file.
+        self._add_error = functools.partial(errors.add, old_idl_dir, new_idl_dir)
 
     def add_command_invalid_api_version_error(self, command_name: str, api_version: str,
                                               file: str) -> None:
         """Add an error about a command with an invalid api version."""
-        self._add_error(ERROR_ID_COMMAND_INVALID_API_VERSION, command_name,
-                        "'%s' has an invalid API version '%s'" % (command_name, api_version), file)
+        self._add_error(ERROR_ID_COMMAND_INVALID_API_VERSION, command_name, (api_version, ), file)
 
     def add_command_removed_error(self, command_name: str, file: str) -> None:
         """Add an error about a command that was removed."""
-        self._add_error(ERROR_ID_REMOVED_COMMAND, command_name,
-                        "Old command '%s' was removed from new commands." % (command_name), file)
+        self._add_error(ERROR_ID_REMOVED_COMMAND, command_name, (), file)
 
     def add_duplicate_command_name_error(self, command_name: str, dir_name: str, file: str) -> None:
         """Add an error about a duplicate command name within a directory."""
-        self._add_error(ERROR_ID_DUPLICATE_COMMAND_NAME, command_name,
-                        "'%s' has duplicate command: '%s'" % (dir_name, command_name), file)
+        self._add_error(ERROR_ID_DUPLICATE_COMMAND_NAME, command_name, (dir_name, ), file)
 
     def add_reply_field_not_subset_error(self, command_name: str, field_name: str, type_name: str,
                                          file: str) -> None:
         """Add an error about the reply field not being a subset."""
-        self._add_error(
-            ERROR_ID_REPLY_FIELD_NOT_SUBSET, command_name,
-            "'%s' has a reply field or sub-field '%s' with type '%s' "
-            "that is not a subset of the other version "
-            "of this reply field." % (command_name, field_name, type_name), file)
+        self._add_error(ERROR_ID_REPLY_FIELD_NOT_SUBSET, command_name, (field_name, type_name),
+                        file)
 
     def add_command_or_param_type_invalid_error(self, command_name: str, file: str,
                                                 field_name: Optional[str],
                                                 is_command_parameter: bool) -> None:
         """Add an error about the command parameter or type being invalid."""
-        if is_command_parameter:
-            self._add_error(
-                ERROR_ID_COMMAND_PARAMETER_TYPE_INVALID, command_name,
-                "The '%s' command has a field or sub-field '%s' that has an invalid type" %
-                (command_name, field_name), file)
-        else:
-            self._add_error(
-                ERROR_ID_COMMAND_TYPE_INVALID, command_name,
-                "'%s' has an invalid type or has a sub-struct with an invalid type" %
-                (command_name), file)
+        error_id = _TYPE_INVALID_ERROR_IDS[is_command_parameter]
+        self._add_error(error_id, command_name, (field_name, ), file)
 
     def add_command_or_param_type_not_superset_error(self, command_name: str, type_name: str,
                                                      file: str, field_name: Optional[str],
                                                      is_command_parameter: bool) -> None:
         # pylint: disable=too-many-arguments
         """Add an error about the command or parameter type not being a superset."""
-        if is_command_parameter:
-            self._add_error(
-                ERROR_ID_COMMAND_PARAMETER_TYPE_NOT_SUPERSET, command_name,
-                "The command '%s' has field or sub-field '%s' with type '%s' that is not a superset of the "
-                "older version of this field type." % (command_name, field_name, type_name), file)
-        else:
-            self._add_error(
-                ERROR_ID_COMMAND_TYPE_NOT_SUPERSET, command_name,
-                "The command '%s' or its sub-struct has type '%s' that is not a superset of "
-                "the older version of this struct type." % (command_name, type_name), file)
+        error_id = _TYPE_NOT_SUPERSET_ERROR_IDS[is_command_parameter]
+        self._add_error(error_id, command_name, (type_name, field_name), file)
 
     def add_command_or_param_type_contains_validator_error(self, command_name: str, field_name: str,
                                                            file: str, type_name: Optional[str],
@@ -305,40 +764,20 @@ class IDLCompatibilityContext(object):
         Add an error about the new command or parameter type containing a validator
         while the old command or parameter type does not.
         """
-        if is_command_parameter:
-            self._add_error(
-                ERROR_ID_COMMAND_PARAMETER_CONTAINS_VALIDATOR, command_name,
-                "Field or sub-field '%s' for new command '%s' contains a validator "
-                "while the old field does not." % (field_name, command_name), file)
-        else:
-            self._add_error(
-                ERROR_ID_COMMAND_TYPE_CONTAINS_VALIDATOR, command_name,
-                "The command '%s' or its sub-struct has type '%s' with field '%s' that "
-                "contains a validator while "
-                "the old struct type does not." % (command_name, type_name, field_name), file)
+        error_id = _TYPE_CONTAINS_VALIDATOR_ERROR_IDS[is_command_parameter]
+        self._add_error(error_id, command_name, (field_name, type_name), file)
 
     def add_command_or_param_type_validators_not_equal_error(
             self, command_name: str, field_name: str, file: str, type_name: Optional[str],
             is_command_parameter: bool) -> None:
         # pylint: disable=too-many-arguments,invalid-name
         """Add an error about the new and old command or parameter type validators not being equal."""
-        if is_command_parameter:
-            self._add_error(
-                ERROR_ID_COMMAND_PARAMETER_VALIDATORS_NOT_EQUAL, command_name,
-                "Validator for field or sub-field '%s' in old command '%s' is not equal "
-                "to the validator in the new version of the field" % (field_name, command_name),
-                file)
-        else:
-            self._add_error(
-                ERROR_ID_COMMAND_TYPE_VALIDATORS_NOT_EQUAL, command_name,
-                "Validator for field '%s' in type '%s' in old command '%s' or its "
-                "sub-struct is not equal to the validator in the new struct type." %
-                (field_name, type_name, command_name), file)
+        error_id = _TYPE_VALIDATORS_NOT_EQUAL_ERROR_IDS[is_command_parameter]
+        self._add_error(error_id, command_name, (field_name, type_name), file)
 
     def add_missing_error_reply_struct_error(self, file: str) -> None:
         """Add an error about the file missing the ErrorReply struct."""
-        self._add_error(ERROR_ID_MISSING_ERROR_REPLY_STRUCT, "n/a",
-                        ("'%s' is missing the ErrorReply struct") % (file), file)
+        self._add_error(ERROR_ID_MISSING_ERROR_REPLY_STRUCT, "n/a", (file, ), file)
 
     def add_new_command_or_param_type_bson_any_error(self, command_name: str, new_type: str,
                                                      file: str, field_name: Optional[str],
@@ -351,17 +790,8 @@ class IDLCompatibilityContext(object):
         bson serialization type being of type 'any' when the old type is non-any or
         when it is not explicitly allowed.
         """
-        if is_command_parameter:
-            self._add_error(
-                ERROR_ID_NEW_COMMAND_PARAMETER_TYPE_BSON_SERIALIZATION_TYPE_ANY, command_name,
-                "The '%s' command has field or sub-field '%s' that has type '%s' "
-                "that has a bson serialization type 'any'" % (command_name, field_name, new_type),
-                file)
-        else:
-            self._add_error(
-                ERROR_ID_NEW_COMMAND_TYPE_BSON_SERIALIZATION_TYPE_ANY, command_name,
-                "The '%s' command or its sub-struct has type '%s' that "
-                "has a bson serialization type 'any'" % (command_name, new_type), file)
+        error_id = _NEW_TYPE_BSON_ANY_ERROR_IDS[is_command_parameter]
+        self._add_error(error_id, command_name, (new_type, field_name), file)
 
     def add_new_command_or_param_type_enum_or_struct_error(
             self, command_name: str, new_type: str, old_type: str, file: str,
@@ -373,19 +803,8 @@ class IDLCompatibilityContext(object):
         Add an error when the new command or command parameter type is an enum or
         struct and the old one is a type that is not an enum or struct.
         """
-        if is_command_parameter:
-            self._add_error(
-                ERROR_ID_NEW_COMMAND_PARAMETER_TYPE_ENUM_OR_STRUCT, command_name,
-                "The command '%s' has field or sub-field '%s' of type '%s' that is an enum or "
-                "struct while the corresponding old field type is a non-enum or "
-                "non-struct of type '%s'." % (command_name, field_name, new_type, old_type), file)
-        else:
-            self._add_error(
-                ERROR_ID_NEW_COMMAND_TYPE_ENUM_OR_STRUCT, command_name,
-                "The command '%s' or its sub-struct has type '%s' that is an enum "
-                "or struct while the corresponding"
-                "old type was a non-enum or struct of type '%s'." % (command_name, new_type,
-                                                                     old_type), file)
+        error_id = _NEW_TYPE_ENUM_OR_STRUCT_ERROR_IDS[is_command_parameter]
+        self._add_error(error_id, command_name, (new_type, old_type, field_name), file)
 
     def add_new_param_or_command_type_field_added_required_error(
             self, command_name: str, field_name: str, file: str, type_name: str,
@@ -398,34 +817,16 @@ class IDLCompatibilityContext(object):
         exist in the old command.
         The added parameter or command type field should be optional.
         """
-        if is_command_parameter:
-            self._add_error(
-                ERROR_ID_ADDED_REQUIRED_COMMAND_PARAMETER, command_name,
-                "New field or sub-field '%s' for command '%s' is required when it should "
-                "be optional." % (field_name, command_name), file)
-        else:
-            self._add_error(
-                ERROR_ID_NEW_COMMAND_TYPE_FIELD_ADDED_REQUIRED, command_name,
-                "The command '%s' or its sub-struct has type '%s' with an added and "
-                "required type field '%s' that did not exist "
-                "in the old struct type." % (command_name, type_name, field_name), file)
+        error_id = _NEW_TYPE_FIELD_ADDED_REQUIRED_ERROR_IDS[is_command_parameter]
+        self._add_error(error_id, command_name, (field_name, type_name), file)
 
     def add_new_param_or_command_type_field_missing_error(self, command_name: str, field_name: str,
                                                           file: str, type_name: str,
                                                           is_command_parameter: bool) -> None:
         # pylint: disable=too-many-arguments
         """Add an error about a parameter or command type field that is missing in the new command."""
-        if is_command_parameter:
-            self._add_error(
-                ERROR_ID_REMOVED_COMMAND_PARAMETER, command_name,
-                "Field or sub-field '%s' for old command '%s' was removed from the corresponding new"
-                "struct." % (field_name, command_name), file)
-        else:
-            self._add_error(
-                ERROR_ID_NEW_COMMAND_TYPE_FIELD_MISSING, command_name,
-                "The command '%s' or its sub-struct has type '%s' that is missing a "
-                "field '%s' that exists in the old struct type." % (command_name, type_name,
-                                                                    field_name), file)
+        error_id = _NEW_TYPE_FIELD_MISSING_ERROR_IDS[is_command_parameter]
+        self._add_error(error_id, command_name, (field_name, type_name), file)
 
     def add_new_param_or_command_type_field_required_error(self, command_name: str, field_name: str,
                                                            file: str, type_name: Optional[str],
@@ -437,17 +838,8 @@ class IDLCompatibilityContext(object):
         Add an error about the new command parameter or command type field being required when
         the corresponding old command parameter or command type field is optional.
         """
-        if is_command_parameter:
-            self._add_error(
-                ERROR_ID_COMMAND_PARAMETER_REQUIRED, command_name,
-                "'%s' has a required field or sub-field '%s' that was optional in the old struct." %
-                (command_name, field_name), file)
-        else:
-            self._add_error(
-                ERROR_ID_NEW_COMMAND_TYPE_FIELD_REQUIRED, command_name,
-                "'%s' or its sub-struct has type '%s' with a required type field '%s' "
-                "that was optional in the old struct type." % (command_name, type_name, field_name),
-                file)
+        error_id = _NEW_TYPE_FIELD_REQUIRED_ERROR_IDS[is_command_parameter]
+        self._add_error(error_id, command_name, (field_name, type_name), file)
 
     def add_new_param_or_command_type_field_stable_required_error(
             self, command_name: str, field_name: str, file: str, type_name: Optional[str],
@@ -460,18 +852,8 @@ class IDLCompatibilityContext(object):
         required when the corresponding old command parameter or command type field is
         unstable.
         """
-        if is_command_parameter:
-            self._add_error(
-                ERROR_ID_COMMAND_PARAMETER_STABLE_REQUIRED, command_name,
-                "'%s' has a stable required field or sub-field '%s' that "
-                "was unstable in the old struct. "
-                "The new field should be optional." % (command_name, field_name), file)
-        else:
-            self._add_error(
-                ERROR_ID_NEW_COMMAND_TYPE_FIELD_STABLE_REQUIRED, command_name,
-                "'%s' or its sub-struct has type '%s' with a stable and required "
-                "type field '%s' that was unstable "
-                "in the old struct type." % (command_name, type_name, field_name), file)
+        error_id = _NEW_TYPE_FIELD_STABLE_REQUIRED_ERROR_IDS[is_command_parameter]
+        self._add_error(error_id, command_name, (field_name, type_name), file)
 
     def add_new_param_or_command_type_field_unstable_error(self, command_name: str, field_name: str,
                                                            file: str, type_name: Optional[str],
@@ -483,17 +865,8 @@ class IDLCompatibilityContext(object):
         Add an error about the new command parameter or command type field being unstable
         when the corresponding old command parameter or command type field is stable.
         """
-        if is_command_parameter:
-            self._add_error(
-                ERROR_ID_COMMAND_PARAMETER_UNSTABLE, command_name,
-                "'%s' has an unstable field or sub-field '%s' that was stable in the old struct." %
-                (command_name, field_name), file)
-        else:
-            self._add_error(
-                ERROR_ID_NEW_COMMAND_TYPE_FIELD_UNSTABLE, command_name,
-                "'%s' or its sub-struct has type '%s' with an unstable "
-                "field '%s' that was stable in the old "
-                "struct type." % (command_name, type_name, field_name), file)
+        error_id = _NEW_TYPE_FIELD_UNSTABLE_ERROR_IDS[is_command_parameter]
+        self._add_error(error_id, command_name, (field_name, type_name), file)
 
     def add_new_command_or_param_type_not_enum_error(
             self, command_name: str, new_type: str, old_type: str, file: str,
@@ -505,36 +878,16 @@ class IDLCompatibilityContext(object):
         Add an error about the new command or parameter type not being an enum when
         the old one is.
         """
-        if is_command_parameter:
-            self._add_error(
-                ERROR_ID_NEW_COMMAND_PARAMETER_TYPE_NOT_ENUM, command_name,
-                "The '%s' command has field or sub-field '%s' of type '%s' that is "
-                "not an enum while the corresponding old field type was an enum of type '%s'." %
-                (command_name, field_name, new_type, old_type), file)
-        else:
-            self._add_error(
-                ERROR_ID_NEW_COMMAND_TYPE_NOT_ENUM, command_name,
-                "'%s' or its sub-struct has type '%s' that is not an enum while the corresponding "
-                "old type was an enum of type '%s'." % (command_name, new_type, old_type), file)
+        error_id = _NEW_TYPE_NOT_ENUM_ERROR_IDS[is_command_parameter]
+        self._add_error(error_id, command_name, (new_type, old_type, field_name), file)
 
     def add_new_command_or_param_type_not_struct_error(
             self, command_name: str, new_type: str, old_type: str, file: str,
             field_name: Optional[str], is_command_parameter: bool) -> None:
         # pylint: disable=too-many-arguments
         """Add an error about the new command or parameter type not being a struct when the old one is."""
-        if is_command_parameter:
-            self._add_error(
-                ERROR_ID_NEW_COMMAND_PARAMETER_TYPE_NOT_STRUCT, command_name,
-                "The '%s' command has field or sub-field '%s' of type '%s' that is "
-                "not a struct while the corresponding old "
-                "field type was a struct of type '%s'." % (command_name, field_name, new_type,
-                                                           old_type), file)
-        else:
-            self._add_error(
-                ERROR_ID_NEW_COMMAND_TYPE_NOT_STRUCT, command_name,
-                "'%s' or its sub-struct has type '%s' that is not a "
-                "struct while the corresponding old type was a struct of type '%s'." %
-                (command_name, new_type, old_type), file)
+        error_id = _NEW_TYPE_NOT_STRUCT_ERROR_IDS[is_command_parameter]
+        self._add_error(error_id, command_name, (new_type, old_type, field_name), file)
 
     def add_new_command_or_param_type_not_variant_type_error(self, command_name: str, new_type: str,
                                                              file: str, field_name: Optional[str],
@@ -547,16 +900,8 @@ class IDLCompatibilityContext(object):
         when the old type is variant.
         """
 
-        if is_command_parameter:
-            self._add_error(ERROR_ID_NEW_COMMAND_PARAMETER_TYPE_NOT_VARIANT, command_name,
-                            ("The '%s' command has field or sub-field '%s' of type '%s' that is "
-                             "not variant while the corresponding old field type is variant.") %
-                            (command_name, field_name, new_type), file)
-        else:
-            self._add_error(ERROR_ID_NEW_COMMAND_TYPE_NOT_VARIANT, command_name,
-                            ("'%s' or its sub-struct has type '%s' that is not "
-                             "variant while the corresponding "
-                             "old type is variant.") % (command_name, new_type), file)
+        error_id = _NEW_TYPE_NOT_VARIANT_TYPE_ERROR_IDS[is_command_parameter]
+        self._add_error(error_id, command_name, (new_type, field_name), file)
 
     def add_new_command_or_param_variant_type_not_superset_error(
             self, command_name: str, variant_type_name: str, file: str, field_name: Optional[str],
@@ -568,44 +913,24 @@ class IDLCompatibilityContext(object):
         Add an error about the new command or parameter variant types not being a superset
         of the old variant types.
         """
-        if is_command_parameter:
-            self._add_error(
-                ERROR_ID_NEW_COMMAND_PARAMETER_VARIANT_TYPE_NOT_SUPERSET, command_name,
-                ("The '%s' command has field or sub-field '%s' of variant types that is not "
-                 "a superset of the corresponding old field variant types: "
-                 "The type '%s' is in the old field types but not the new field types.") %
-                (command_name, field_name, variant_type_name), file)
-        else:
-            self._add_error(ERROR_ID_NEW_COMMAND_VARIANT_TYPE_NOT_SUPERSET, command_name,
-                            ("'%s' or its sub-struct has variant types that is not a supserset "
-                             "of the corresponding"
-                             " old command variant types: The type '%s' "
-                             "is in the old command types but not the new command types.") %
-                            (command_name, variant_type_name), file)
+        error_id = _NEW_VARIANT_TYPE_NOT_SUPERSET_ERROR_IDS[is_command_parameter]
+        self._add_error(error_id, command_name, (variant_type_name, field_name), file)
 
     def add_new_namespace_incompatible_error(self, command_name: str, old_namespace: str,
                                              new_namespace: str, file: str) -> None:
         """Add an error about the new namespace being incompatible with the old namespace."""
-        self._add_error(
-            ERROR_ID_NEW_NAMESPACE_INCOMPATIBLE, command_name,
-            "'%s' has namespace '%s' that is incompatible with the old namespace '%s'." %
-            (command_name, new_namespace, old_namespace), file)
+        self._add_error(ERROR_ID_NEW_NAMESPACE_INCOMPATIBLE, command_name,
+                        (new_namespace, old_namespace), file)
 
     def add_new_reply_field_missing_error(self, command_name: str, field_name: str,
                                           file: str) -> None:
         """Add an error about the new command missing a reply field that exists in the old command."""
-        self._add_error(
-            ERROR_ID_NEW_REPLY_FIELD_MISSING, command_name,
-            "'%s' is missing a reply field or sub-field '%s' that exists in the old command." %
-            (command_name, field_name), file)
+        self._add_error(ERROR_ID_NEW_REPLY_FIELD_MISSING, command_name, (field_name, ), file)
 
     def add_new_reply_field_optional_error(self, command_name: str, field_name: str,
                                            file: str) -> None:
         """Add an error about the new command reply field being optional when the old reply field is not."""
-        self._add_error(
-            ERROR_ID_NEW_REPLY_FIELD_OPTIONAL, command_name,
-            "'%s' has an optional reply field or sub-field '%s' "
-            "that was non-optional in the old command." % (command_name, field_name), file)
+        self._add_error(ERROR_ID_NEW_REPLY_FIELD_OPTIONAL, command_name, (field_name, ), file)
 
     def add_new_reply_field_bson_any_error(self, command_name: str, field_name: str,
                                            new_field_type: str, file: str) -> None:
@@ -616,9 +941,7 @@ class IDLCompatibilityContext(object):
         'any' when it was not 'any' in the old type or it is not explicitly allowed.
         """
         self._add_error(ERROR_ID_NEW_REPLY_FIELD_BSON_SERIALIZATION_TYPE_ANY, command_name,
-                        ("'%s' has a new reply field or sub-field '%s' of type '%s' "
-                         "that has a bson serialization type 'any'") % (command_name, field_name,
-                                                                        new_field_type), file)
+                        (field_name, new_field_type), file)
 
     def add_reply_field_bson_any_not_allowed_error(self, command_name: str, field_name: str,
                                                    type_name: str, file: str) -> None:
@@ -629,18 +952,13 @@ class IDLCompatibilityContext(object):
         type 'any' when it is not explicitly allowed.
         """
         self._add_error(ERROR_ID_REPLY_FIELD_BSON_SERIALIZATION_TYPE_ANY_NOT_ALLOWED, command_name,
-                        ("'%s' has an old and new reply field or sub-field '%s' of type '%s' "
-                         "that has a bson serialization type 'any' when it "
-                         "is not explicitly allowed.") % (command_name, field_name, type_name),
-                        file)
+                        (field_name, type_name), file)
 
     def add_reply_field_cpp_type_not_equal_error(self, command_name: str, field_name: str,
                                                  type_name: str, file: str) -> None:
         """Add an error about the old and new reply field cpp_type not being equal."""
         self._add_error(ERROR_ID_REPLY_FIELD_CPP_TYPE_NOT_EQUAL, command_name,
-                        ("'%s' has a reply field or sub-field '%s' of type '%s' that has cpp_type "
-                         "that is not equal in the old and new versions.") %
-                        (command_name, field_name, type_name), file)
+                        (field_name, type_name), file)
 
     def add_new_reply_field_type_not_enum_error(self, command_name: str, field_name: str,
                                                 new_field_type: str, old_field_type: str,
@@ -648,10 +966,7 @@ class IDLCompatibilityContext(object):
         # pylint: disable=too-many-arguments
         """Add an error about the new reply field type not being an enum when the old one is."""
         self._add_error(ERROR_ID_NEW_REPLY_FIELD_TYPE_NOT_ENUM, command_name,
-                        ("'%s' has a reply field or sub-field '%s' of type '%s' "
-                         "that is not an enum while the corresponding "
-                         "old reply field was an enum of type '%s'.") %
-                        (command_name, field_name, new_field_type, old_field_type), file)
+                        (field_name, new_field_type, old_field_type), file)
 
     def add_new_reply_field_type_not_struct_error(self, command_name: str, field_name: str,
                                                   new_field_type: str, old_field_type: str,
@@ -659,10 +974,7 @@ class IDLCompatibilityContext(object):
         # pylint: disable=too-many-arguments
         """Add an error about the new reply field type not being a struct when the old one is."""
         self._add_error(ERROR_ID_NEW_REPLY_FIELD_TYPE_NOT_STRUCT, command_name,
-                        ("'%s' has a reply field or sub-field '%s' of type '%s' "
-                         "that is not a struct while the corresponding "
-                         "old reply field was a struct of type '%s'.") %
-                        (command_name, field_name, new_field_type, old_field_type), file)
+                        (field_name, new_field_type, old_field_type), file)
 
     def add_new_reply_field_type_enum_or_struct_error(self, command_name: str, field_name: str,
                                                       new_field_type: str, old_field_type: str,
@@ -675,28 +987,19 @@ class IDLCompatibilityContext(object):
         and the old reply field is a non-enum or struct type.
         """
         self._add_error(ERROR_ID_NEW_REPLY_FIELD_TYPE_ENUM_OR_STRUCT, command_name,
-                        ("'%s' has a reply field or sub-field '%s' of type '%s' that is an "
-                         "enum or struct while the corresponding "
-                         "old reply field was a non-enum or struct of type '%s'.") %
-                        (command_name, field_name, new_field_type, old_field_type), file)
+                        (field_name, new_field_type, old_field_type), file)
 
     def add_new_reply_field_unstable_error(self, command_name: str, field_name: str,
                                            file: str) -> None:
         """Add an error about the new command reply field being unstable when the old one is stable."""
-        self._add_error(
-            ERROR_ID_NEW_REPLY_FIELD_UNSTABLE, command_name,
-            "'%s' has an unstable reply field or sub-field '%s' "
-            "that was stable in the old command." % (command_name, field_name), file)
+        self._add_error(ERROR_ID_NEW_REPLY_FIELD_UNSTABLE, command_name, (field_name, ), file)
 
     def add_new_reply_field_variant_type_error(self, command_name: str, field_name: str,
                                                old_field_type: str, file: str) -> None:
         # pylint: disable=too-many-arguments
         """Add an error about the new reply field type being variant when the old one is not."""
         self._add_error(ERROR_ID_NEW_REPLY_FIELD_VARIANT_TYPE, command_name,
-                        ("'%s' has a reply field or sub-field '%s' that has a variant "
-                         "type while the corresponding "
-                         "old reply field type '%s' is not variant.") % (command_name, field_name,
-                                                                         old_field_type), file)
+                        (field_name, old_field_type), file)
 
     def add_new_reply_field_variant_type_not_subset_error(
             self, command_name: str, field_name: str, variant_type_name: str, file: str) -> None:
@@ -707,12 +1010,8 @@ class IDLCompatibilityContext(object):
         Add an error about the new reply field variant types
         not being a subset of the old variant types.
         """
-        self._add_error(
-            ERROR_ID_NEW_REPLY_FIELD_VARIANT_TYPE_NOT_SUBSET, command_name,
-            ("'%s' has a reply field or sub-field '%s' with variant types that is "
-             "not a subset of the corresponding "
-             "old reply field types: The type '%s' is not in the old reply field types.") %
-            (command_name, field_name, variant_type_name), file)
+        self._add_error(ERROR_ID_NEW_REPLY_FIELD_VARIANT_TYPE_NOT_SUBSET, command_name,
+                        (field_name, variant_type_name), file)
 
     def add_old_command_or_param_type_bson_any_error(self, command_name: str, old_type: str,
                                                      file: str, field_name: Optional[str],
@@ -725,16 +1024,8 @@ class IDLCompatibilityContext(object):
         bson serialization type being of type 'any' when the new type is non-any or
         when it is not explicitly allowed.
         """
-        if is_command_parameter:
-            self._add_error(
-                ERROR_ID_OLD_COMMAND_PARAMETER_TYPE_BSON_SERIALIZATION_TYPE_ANY, command_name,
-                "The '%s'' command has field or sub-field '%s' that has type '%s' "
-                "that has a bson serialization type 'any'" % (command_name, field_name, old_type),
-                file)
-        else:
-            self._add_error(ERROR_ID_OLD_COMMAND_TYPE_BSON_SERIALIZATION_TYPE_ANY, command_name,
-                            ("'%s' or its sub-struct has type '%s' that has a "
-                             "bson serialization type 'any'") % (command_name, old_type), file)
+        error_id = _OLD_TYPE_BSON_ANY_ERROR_IDS[is_command_parameter]
+        self._add_error(error_id, command_name, (old_type, field_name), file)
 
     def add_command_or_param_type_bson_any_not_allowed_error(
             self, command_name: str, type_name: str, file: str, field_name: Optional[str],
@@ -746,35 +1037,16 @@ class IDLCompatibilityContext(object):
         Add an error about the old and new command or parameter type's bson serialization type
         being of type 'any' when it is not explicitly allowed.
         """
-        if is_command_parameter:
-            self._add_error(ERROR_ID_COMMAND_PARAMETER_BSON_SERIALIZATION_TYPE_ANY_NOT_ALLOWED,
-                            command_name,
-                            ("'%s' has an old and new field or sub-field '%s' of type "
-                             "'%s' that has a bson "
-                             "serialization type 'any' when it is not explicitly allowed.") %
-                            (command_name, field_name, type_name), file)
-        else:
-            self._add_error(
-                ERROR_ID_COMMAND_TYPE_BSON_SERIALIZATION_TYPE_ANY_NOT_ALLOWED, command_name,
-                ("'%s' or its sub-struct has an old and new type '%s' that has a bson "
-                 "serialization type 'any' when it is not explicitly allowed.") % (command_name,
-                                                                                   type_name), file)
+        error_id = _TYPE_BSON_ANY_NOT_ALLOWED_ERROR_IDS[is_command_parameter]
+        self._add_error(error_id, command_name, (type_name, field_name), file)
 
     def add_command_or_param_cpp_type_not_equal_error(self, command_name: str, type_name: str,
                                                       file: str, field_name: Optional[str],
                                                       is_command_parameter: bool) -> None:
         # pylint: disable=too-many-arguments,invalid-name
         """Add an error about the old and new command or param cpp_type not being equal."""
-        if is_command_parameter:
-            self._add_error(ERROR_ID_COMMAND_PARAMETER_CPP_TYPE_NOT_EQUAL, command_name,
-                            ("'%s' has field or sub-field '%s' of type '%s' that has  "
-                             "cpp_type that is not equal in the old and new versions") %
-                            (command_name, field_name, type_name), file)
-        else:
-            self._add_error(
-                ERROR_ID_COMMAND_CPP_TYPE_NOT_EQUAL, command_name,
-                ("'%s' or its sub-struct has command type '%s' that has cpp_type "
-                 "that is not equal in the old and new versions") % (command_name, type_name), file)
+        error_id = _CPP_TYPE_NOT_EQUAL_ERROR_IDS[is_command_parameter]
+        self._add_error(error_id, command_name, (type_name, field_name), file)
 
     def add_old_reply_field_bson_any_error(self, command_name: str, field_name: str,
                                            old_field_type: str, file: str) -> None:
@@ -785,52 +1057,38 @@ class IDLCompatibilityContext(object):
         'any' when the new type is non-any or when it is not explicitly allowed.
         """
         self._add_error(ERROR_ID_OLD_REPLY_FIELD_BSON_SERIALIZATION_TYPE_ANY, command_name,
-                        ("'%s' has an old reply field or sub-field '%s' of type '%s' "
-                         "that has a bson serialization type 'any'") % (command_name, field_name,
-                                                                        old_field_type), file)
+                        (field_name, old_field_type), file)
 
     def add_reply_field_contains_validator_error(self, command_name: str, field_name: str,
                                                  file: str) -> None:
         """Add an error about the reply field containing a validator."""
-        self._add_error(ERROR_ID_REPLY_FIELD_CONTAINS_VALIDATOR, command_name,
-                        ("The new version of the command '%s' has a reply field or sub-field '%s' "
-                         "that contains a validator while the old version does not") %
-                        (command_name, field_name), file)
+        self._add_error(ERROR_ID_REPLY_FIELD_CONTAINS_VALIDATOR, command_name, (field_name, ), file)
 
     def add_reply_field_validators_not_equal_error(self, command_name: str, field_name: str,
                                                    file: str) -> None:
         """Add an error about the reply field containing a validator."""
-        self._add_error(ERROR_ID_REPLY_FIELD_VALIDATORS_NOT_EQUAL, command_name,
-                        ("Validator for reply field or sub-field '%s' in old command '%s' "
-                         "is not equal to the validator in the new version of the reply field") %
-                        (command_name, field_name), file)
+        self._add_error(ERROR_ID_REPLY_FIELD_VALIDATORS_NOT_EQUAL, command_name, (field_name, ),
+                        file)
 
     def add_reply_field_type_invalid_error(self, command_name: str, field_name: str,
                                            file: str) -> None:
         """Add an error about the reply field or sub-field type being invalid."""
-        self._add_error(ERROR_ID_REPLY_FIELD_TYPE_INVALID, command_name,
-                        ("'%s' has a reply field or sub-field '%s' that has an invalid type") %
-                        (command_name, field_name), file)
+        self._add_error(ERROR_ID_REPLY_FIELD_TYPE_INVALID, command_name, (field_name, ), file)
 
     def add_check_not_equal_error(self, command_name: str, old_check: str, new_check: str,
                                   file: str) -> None:
         """Add an error about the command access_check check not being equal."""
-        self._add_error(ERROR_ID_CHECK_NOT_EQUAL, command_name,
-                        ("'%s' has a new check '%s' that is not equal to the old check '%s'") %
-                        (command_name, new_check, old_check), file)
+        self._add_error(ERROR_ID_CHECK_NOT_EQUAL, command_name, (new_check, old_check), file)
 
     def add_resource_pattern_not_equal_error(self, command_name: str, old_resource_pattern: str,
                                              new_resource_pattern: str, file: str) -> None:
         """Add an error about the command access_check resource_pattern not being equal."""
-        self._add_error(ERROR_ID_RESOURCE_PATTERN_NOT_EQUAL, command_name, (
-            "'%s' has a new resource pattern '%s' that is not equal to the old resource pattern '%s'"
-        ) % (command_name, new_resource_pattern, old_resource_pattern), file)
+        self._add_error(ERROR_ID_RESOURCE_PATTERN_NOT_EQUAL, command_name,
+                        (new_resource_pattern, old_resource_pattern), file)
 
     def add_new_action_types_not_subset_error(self, command_name: str, file: str) -> None:
         """Add an error about the command access_check check not being equal."""
-        self._add_error(ERROR_ID_NEW_ACTION_TYPES_NOT_SUBSET, command_name,
-                        ("'%s' has new action types that are not a subset of the old action types")
-                        % (command_name), file)
+        self._add_error(ERROR_ID_NEW_ACTION_TYPES_NOT_SUBSET, command_name, (), file)
 
     def add_type_not_array_error(self, symbol: str, command_name: str, symbol_name: str,
                                  new_type: str, old_type: str, file: str) -> None:
@@ -841,23 +1099,27 @@ class IDLCompatibilityContext(object):
         This is a general error for each case where ArrayType is missing from (command type,
         command parameter type).
         """
-        self._add_error(
-            ERROR_ID_TYPE_NOT_ARRAY, command_name,
-            "The command '%s' has %s: '%s' with new type '%s' while the older type was '%s'." %
-            (command_name, symbol, symbol_name, new_type, old_type), file)
+        self._add_error(ERROR_ID_TYPE_NOT_ARRAY, command_name,
+                        (symbol, symbol_name, new_type, old_type), file,
+                        _TYPE_NOT_ARRAY_CATEGORIES[symbol])
+
+
+# All the error codes prefixed with ERROR_ID, collected once on file load.
+_ALL_ERROR_IDS = tuple(
+    v for k, v in globals().items() if k.startswith("ERROR_ID_") and isinstance(v, str))
 
 
 def _assert_unique_error_messages() -> None:
-    """Assert that error codes are unique."""
-    error_ids = []
-    for module_member in inspect.getmembers(sys.modules[__name__]):
-        if module_member[0].startswith("ERROR_ID"):
-            error_ids.append(module_member[1])
-
-    error_ids_set = set(error_ids)
-    if len(error_ids) != len(error_ids_set):
+    """Assert that error codes are unique and that each has a message template and a category."""
+    if len(set(_ALL_ERROR_IDS)) != len(_ALL_ERROR_IDS):
         raise IDLCompatibilityCheckerError(
             "IDL Compatibility Checker error codes prefixed with ERROR_ID are not unique.")
+    if set(_TEMPLATES) != set(_ALL_ERROR_IDS):
+        raise IDLCompatibilityCheckerError(
+            "Every IDL Compatibility Checker error code must have a message template.")
+    if set(_CATEGORIES) | {ERROR_ID_TYPE_NOT_ARRAY} != set(_ALL_ERROR_IDS):
+        raise IDLCompatibilityCheckerError(
+            "Every IDL Compatibility Checker error code must have a category.")
 
 
 # On file import, check the error messages are unique
@@ -29,6 +29,8 @@
 #
 """Test cases for IDL compatibility checker."""
 
+import contextlib
+import io
 import unittest
 import sys
 from os import path
@@ -771,6 +773,132 @@ class TestIDLCompatibilityChecker(unittest.TestCase):
             idl_compatibility_errors.ERROR_ID_NEW_REPLY_FIELD_OPTIONAL)
         self.assertRegex(str(new_error_reply_field_optional_error), "n/a")
 
+    def test_duplicate_errors_are_added_once(self):
+        """Tests that adding an identical error more than once records it only once."""
+        error_collection = idl_compatibility_errors.IDLCompatibilityErrorCollection()
+        ctxt = idl_compatibility_errors.IDLCompatibilityContext("old", "new", error_collection)
+
+        ctxt.add_new_reply_field_missing_error("testCommand", "field1", "file.idl")
+        ctxt.add_new_reply_field_missing_error("testCommand", "field1", "file.idl")
+        self.assertTrue(error_collection.count() == 1)
+
+        # The same error about a different field is still a separate error.
+        ctxt.add_new_reply_field_missing_error("testCommand", "field2", "file.idl")
+        self.assertTrue(error_collection.count() == 2)
+
+    def test_duplicate_errors_from_shared_sub_struct(self):
+        """Tests that an error reached through two fields of the same struct type is one error."""
+        dir_path = path.dirname(path.realpath(__file__))
+        error_collection = idl_check_compatibility.check_compatibility(
+            path.join(dir_path, "compatibility_test_fail/duplicate_error/old"),
+            path.join(dir_path, "compatibility_test_fail/duplicate_error/new"), ["src"])
+
+        # Both firstField and secondField are missing the removed sub-field.
+        self.assertTrue(error_collection.count() == 1)
+        error = error_collection.get_error_by_command_name("sharedSubStructFieldRemoved")
+        self.assertTrue(error.error_id == idl_compatibility_errors.ERROR_ID_NEW_REPLY_FIELD_MISSING)
+        self.assertRegex(str(error), "removedField")
+
+    def test_error_command_names_are_shared(self):
+        """Tests that errors built from equal command names share one interned string."""
+        error_collection = idl_compatibility_errors.IDLCompatibilityErrorCollection()
+        ctxt = idl_compatibility_errors.IDLCompatibilityContext("old", "new", error_collection)
+
+        ctxt.add_new_reply_field_missing_error("".join(["test", "Command"]), "field1", "file.idl")
+        ctxt.add_new_reply_field_missing_error("".join(["test", "Command"]), "field2", "file.idl")
+        first_error, second_error = error_collection.get_all_errors_by_command_name("testCommand")
+        self.assertIs(first_error.command_name, second_error.command_name)
+        self.assertRegex(str(second_error), "'testCommand' is missing a reply field")
+
+    def test_errors_are_passed_to_sink(self):
+        """Tests that a collection with a sink passes every error to it instead of keeping them."""
+        sunk_errors = []
+        error_collection = idl_compatibility_errors.IDLCompatibilityErrorCollection(
+            sunk_errors.append)
+        ctxt = idl_compatibility_errors.IDLCompatibilityContext("old", "new", error_collection)
+
+        ctxt.add_new_reply_field_missing_error("testCommand", "field1", "file.idl")
+        ctxt.add_new_reply_field_missing_error("testCommand", "field1", "file.idl")
+        self.assertTrue(error_collection.has_errors())
+        # Errors passed to a sink are not remembered, so a duplicate is passed on again.
+        self.assertTrue(error_collection.count() == 2)
+        self.assertTrue(len(sunk_errors) == 2)
+        self.assertTrue(
+            sunk_errors[0].error_id == idl_compatibility_errors.ERROR_ID_NEW_REPLY_FIELD_MISSING)
+        self.assertTrue(
+            sunk_errors[0].category == idl_compatibility_errors.ErrorCategory.REPLY_FIELD)
+
+        # The errors are not kept, so they cannot be looked up or listed.
+        with self.assertRaises(idl_compatibility_errors.IDLCompatibilityCheckerError):
+            error_collection.contains(idl_compatibility_errors.ERROR_ID_NEW_REPLY_FIELD_MISSING)
+        with self.assertRaises(idl_compatibility_errors.IDLCompatibilityCheckerError):
+            error_collection.get_error_by_command_name("testCommand")
+        with self.assertRaises(idl_compatibility_errors.IDLCompatibilityCheckerError):
+            error_collection.to_list()
+
+    def test_should_fail_with_sink(self):
+        """Tests that incompatible old and new IDL commands pass their errors to a sink."""
+        dir_path = path.dirname(path.realpath(__file__))
+        sunk_errors = []
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            error_collection = idl_check_compatibility.check_compatibility(
+                path.join(dir_path, "compatibility_test_fail/old"),
+                path.join(dir_path, "compatibility_test_fail/new"), ["src"], sunk_errors.append)
+
+        self.assertTrue(error_collection.has_errors())
+        self.assertTrue(error_collection.count() == 100)
+        self.assertTrue(len(sunk_errors) == 100)
+        # Only the number of errors is printed, the errors themselves went to the sink.
+        self.assertTrue(output.getvalue() == "Found 100 errors\n")
+
+    def test_error_categories(self):
+        """Tests that every error id has a category and errors report the right one."""
+        # pylint: disable=protected-access
+        for error_id in idl_compatibility_errors._ALL_ERROR_IDS:
+            if error_id == idl_compatibility_errors.ERROR_ID_TYPE_NOT_ARRAY:
+                self.assertNotIn(error_id, idl_compatibility_errors._CATEGORIES)
+            else:
+                self.assertIsInstance(idl_compatibility_errors._CATEGORIES[error_id],
+                                      idl_compatibility_errors.ErrorCategory)
+
+        error_collection = idl_compatibility_errors.IDLCompatibilityErrorCollection()
+        ctxt = idl_compatibility_errors.IDLCompatibilityContext("old", "new", error_collection)
+        ctxt.add_new_reply_field_missing_error("replyFieldCommand", "field", "file.idl")
+        ctxt.add_command_or_param_type_invalid_error("paramCommand", "file.idl", "param", True)
+        ctxt.add_command_or_param_type_invalid_error("typeCommand", "file.idl", None, False)
+        ctxt.add_new_namespace_incompatible_error("namespaceCommand", "concatenate_with_db",
+                                                  "ignored", "file.idl")
+        self.assertTrue(
+            error_collection.get_error_by_command_name("replyFieldCommand").category ==
+            idl_compatibility_errors.ErrorCategory.REPLY_FIELD)
+        self.assertTrue(
+            error_collection.get_error_by_command_name("paramCommand").category ==
+            idl_compatibility_errors.ErrorCategory.COMMAND_PARAMETER)
+        self.assertTrue(
+            error_collection.get_error_by_command_name("typeCommand").category ==
+            idl_compatibility_errors.ErrorCategory.COMMAND_TYPE)
+        self.assertTrue(
+            error_collection.get_error_by_command_name("namespaceCommand").category ==
+            idl_compatibility_errors.ErrorCategory.NAMESPACE)
+
+        # ERROR_ID_TYPE_NOT_ARRAY is categorized by the kind of symbol it is about.
+        ctxt.add_type_not_array_error("reply_field", "replyFieldArrayCommand", "type", "new", "old",
+                                      "file.idl")
+        ctxt.add_type_not_array_error("command_parameter", "paramArrayCommand", "param", "new",
+                                      "old", "file.idl")
+        ctxt.add_type_not_array_error("command_namespace", "typeArrayCommand", "type", "new", "old",
+                                      "file.idl")
+        self.assertTrue(
+            error_collection.get_error_by_command_name("replyFieldArrayCommand").category ==
+            idl_compatibility_errors.ErrorCategory.REPLY_FIELD)
+        self.assertTrue(
+            error_collection.get_error_by_command_name("paramArrayCommand").category ==
+            idl_compatibility_errors.ErrorCategory.COMMAND_PARAMETER)
+        self.assertTrue(
+            error_collection.get_error_by_command_name("typeArrayCommand").category ==
+            idl_compatibility_errors.ErrorCategory.COMMAND_TYPE)
+
 
 if __name__ == '__main__':
     unittest.main()